@@ -1,2 +1,16 @@
 """Storz & Bickel Volcano BLE assistant"""
-from volcanobt.volcano import Volcano
\ No newline at end of file
+import logging
+
+# Library modules should stay silent unless the application configures logging
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+
+def __getattr__(name: str):
+    # Re-export lazily so importing the package doesn't pull in bleak
+    # until Volcano is actually used
+    if name == 'Volcano':
+        from volcanobt.volcano import Volcano
+
+        return Volcano
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
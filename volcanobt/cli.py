@@ -2,9 +2,13 @@ import logging
 
 import click
 
+@click.command()
 @click.option("--mac", envvar="VOLCANO_MAC", required=True)
 @click.option("--interface", default=None)
 @click.option("--debug/--normal", default=False)
 @click.pass_context
 def run(ctx, mac: str, interface: str, debug: bool):
+    # Logging is configured by the application, not the library modules
+    logging.basicConfig(level=logging.DEBUG if debug else logging.WARNING)
+
     print("Hello!")
@@ -1,28 +1,116 @@
 """The bluetooth connection."""
 import logging
 import asyncio
+import json
+import sys
+from pathlib import Path
 
-from bleak import BleakScanner, BleakClient
+from bleak import BleakClient, BleakScanner
 from bleak.backends.service import BleakGATTServiceCollection, BleakGATTService
+from bleak.exc import BleakError
+from bleak_retry_connector import establish_connection, get_device
 
 _LOGGER = logging.getLogger(__name__)
 
+GATT_CACHE_DIR = Path.home() / '.cache' / 'volcanobt'
+
 class BTLEConnection():
     """BTLE Connection class"""
 
+    __slots__ = ('_mac', '_conn', '_services', '_io_lock')
+
+    # Resolved GATT databases keyed by MAC, shared across instances so a
+    # reconnect to a known device can skip the multi-second discovery phase
+    _service_cache: dict = {}
+
     def __init__(self, mac: str):
         self._mac = mac
+        # Serialize GATT operations so concurrent reads/writes don't
+        # interleave chaotically inside BlueZ and trigger spurious timeouts
+        self._io_lock = asyncio.Lock()
+
+    def _request_connection_interval(self) -> None:
+        """Best-effort shorter BLE connection interval on Linux/BlueZ.
+
+        Every GATT operation is bounded by the connection interval and the
+        BlueZ default (~50 ms) caps write throughput. The debugfs tunables
+        (units of 1.25 ms) need root and may not exist, so failures are
+        silently ignored.
+        """
+        if not sys.platform.startswith('linux'):
+            return
+
+        try:
+            with open('/sys/kernel/debug/bluetooth/hci0/conn_min_interval', 'w') as attr:
+                attr.write('12')
+            with open('/sys/kernel/debug/bluetooth/hci0/conn_max_interval', 'w') as attr:
+                attr.write('24')
+        except OSError:
+            _LOGGER.debug('Could not request a shorter connection interval')
 
     async def connect(self) -> bool:
-        device = await BleakScanner.find_device_by_address(self._mac, timeout=20.0)
+        # Applies to connections set up afterwards, so request it first
+        self._request_connection_interval()
+
+        # establish_connection needs a resolved BLEDevice, not a bare
+        # address; ask the platform's device cache first and only fall
+        # back to a discovery scan for a device it has never seen
+        device = await get_device(self._mac)
+
+        if device is None:
+            device = await BleakScanner.find_device_by_address(self._mac)
+
+        if device is None:
+            raise BleakError(f'Volcano with address {self._mac} was not found')
+
+        # The Volcano GATT layout is fixed, so bleak's service cache is
+        # safe to reuse for any device we have connected to before
+        known = self._mac in BTLEConnection._service_cache or self._has_gatt_cache()
+
+        # establish_connection retries with backoff and connects to the
+        # resolved device directly, skipping the (up to 20s) discovery
+        # scan; it resolves services during connect, honoring the cache
+        self._conn = await establish_connection(
+            BleakClient,
+            device,
+            name=self._mac,
+            disconnected_callback=self._disconnected_callback,
+            use_services_cache=known,
+            max_attempts=4,
+        )
+
+        self._services = self._conn.services
+        BTLEConnection._service_cache[self._mac] = self._services
+
+        if not known:
+            self._store_gatt_cache()
+
+        return self._conn.is_connected
 
-        _LOGGER.info(device)
+    def _gatt_cache_path(self) -> Path:
+        return GATT_CACHE_DIR / (self._mac.lower().replace(':', '-') + '.json')
 
-        self._conn = BleakClient(device, disconnected_callback=self._disconnected_callback)
-        result = await self._conn.connect()
-        self._services = await self._conn.get_services()
+    def _has_gatt_cache(self) -> bool:
+        return self._gatt_cache_path().is_file()
 
-        return result
+    def _store_gatt_cache(self) -> None:
+        """Persist the discovered GATT layout keyed by MAC.
+
+        A later process finding this file knows the device and can reuse
+        bleak's service cache instead of re-walking the GATT database.
+        """
+        chars = {}
+
+        for service in self._services:
+            for char in service.characteristics:
+                chars[char.uuid] = {'handle': char.handle, 'properties': char.properties}
+
+        try:
+            path = self._gatt_cache_path()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(chars))
+        except OSError:
+            _LOGGER.debug('Could not persist GATT cache for %s', self._mac)
     
     async def disconnect(self) -> bool:
         return await self._conn.disconnect()
@@ -40,11 +128,19 @@ class BTLEConnection():
     async def stop_notify(self, char_uuid) -> None:
         return await self._conn.stop_notify(char_uuid)
 
-    async def write_gatt_char(self, service, val) -> None:
-        return await self._conn.write_gatt_char(service, val)
+    async def write_gatt_char(self, service, val, response: bool = True) -> None:
+        async with self._io_lock:
+            return await self._conn.write_gatt_char(service, val, response=response)
+
+    async def write_gatt_char_batch(self, pairs) -> None:
+        """Issue several writes back-to-back under a single lock acquisition."""
+        async with self._io_lock:
+            for service, val in pairs:
+                await self._conn.write_gatt_char(service, val)
 
     async def read_gatt_char(self, service) -> bytearray:
-        return await self._conn.read_gatt_char(service)
+        async with self._io_lock:
+            return await self._conn.read_gatt_char(service)
 
     def _disconnected_callback(self, client: BleakClient) -> None:
         _LOGGER.error("DISCONNECTED FOR SOME REASON")
@@ -1,13 +1,13 @@
 import asyncio
 import curses
-import math
+import inspect
 import logging
+import os
 import signal
+import sys
 import _curses
 from abc import ABC, abstractmethod
 
-from volcanobt.volcano import Volcano
-
 _LOGGER = logging.getLogger(__name__)
 
 VOLCANO_MAC = ''
@@ -16,6 +16,7 @@ class Display(ABC):
     def __init__(self, screen: '_curses._CursesWindow'):
         self.screen = screen
         self.done: bool = False
+        self._wake = asyncio.Event()
 
     @abstractmethod
     def make_display(self) -> None:
@@ -27,67 +28,159 @@ class Display(ABC):
 
     def set_exit(self) -> None:
         self.done = True
+        self._wake.set()
+
+    def refresh(self) -> None:
+        """Request a repaint, e.g. from a BLE notification callback."""
+        self._wake.set()
+
+    def _on_resize(self) -> None:
+        # Our SIGWINCH handler displaces the one ncurses installed, so
+        # curses never learns the new size on its own: fetch it from the
+        # terminal and resize the screen before the repaint runs
+        size = os.get_terminal_size(sys.stdout.fileno())
+        curses.resizeterm(size.lines, size.columns)
+        self._wake.set()
 
     async def run(self) -> None:
+        # Wake on actual key presses instead of polling getch() on a timer,
+        # so the event loop stays free to service BLE notifications
+        loop = asyncio.get_running_loop()
+        loop.add_reader(sys.stdin.fileno(), self._wake.set)
+        # Terminal resizes arrive as SIGWINCH, not as readable stdin
+        loop.add_signal_handler(signal.SIGWINCH, self._on_resize)
+
         self.make_display()
 
-        while not self.done:
-            await asyncio.sleep(0.1)
-            char = self.screen.getch()
-            if char == curses.ERR:
-                await asyncio.sleep(0.1)
-            elif char == curses.KEY_RESIZE:
-                self.make_display()
-            else:
-                await self.handle_char(char)
+        try:
+            while not self.done:
+                await self._wake.wait()
+                self._wake.clear()
+
+                char = self.screen.getch()
+                while char != curses.ERR:
+                    if char != curses.KEY_RESIZE:
+                        await self.handle_char(char)
+                    char = self.screen.getch()
 
-            self.make_display()
+                self.make_display()
+        finally:
+            loop.remove_reader(sys.stdin.fileno())
+            loop.remove_signal_handler(signal.SIGWINCH)
 
 
 class MyDisplay(Display):
-    def __init__(self, screen: '_curses._CursesWindow', volcano: Volcano):
+    def __init__(self, screen: '_curses._CursesWindow', volcano: 'Volcano'):
         self.volcano = volcano
+        self._last = {}
+        self._size = None
+        self._center = None
+        self._pending_target = None
+        self._debounce_task = None
+        self._keymap = {
+            ord('q'): self.set_exit,
+            curses.KEY_UP: lambda: self._adjust_target(1),
+            curses.KEY_DOWN: lambda: self._adjust_target(-1),
+            curses.KEY_LEFT: volcano.toggle_heater,
+            curses.KEY_RIGHT: volcano.toggle_pump,
+        }
         super().__init__(screen)
 
     def make_display(self) -> None:
         h, w = self.screen.getmaxyx()
 
-        cy = math.floor(h / 2)
-        cx = math.floor(w / 2)
+        if (h, w) != self._size:
+            # Geometry changed, recompute the layout and repaint everything
+            self._size = (h, w)
+            self._center = (h // 2, w // 2)
+            self._last = {}
+            self.screen.erase()
+
+        cy, cx = self._center
+
+        # Pad values so a shorter string fully overwrites the previous one
+        heater_on = 'ON ' if self.volcano.heater_on else 'OFF'
+        pump_on = 'ON ' if self.volcano.pump_on else 'OFF'
+
+        fields = {
+            (cy - 2, cx - 7): ('Heater: ', 0),
+            (cy - 2, cx + 1): (heater_on, curses.color_pair(1 if self.volcano.heater_on else 2)),
+            (cy - 1, cx - 5): ('Pump: ', 0),
+            (cy - 1, cx + 1): (pump_on, curses.color_pair(1 if self.volcano.pump_on else 2)),
+            (cy, cx - 12): (f'Target Temp: {self.target_temperature:<7}', 0),
+            (cy + 1, cx - 13): (f'Current Temp: {self.volcano.temperature:<7}', 0),
+
+            (h - 5, 0): (f'Auto off time: {self.volcano._auto_off_time!s:<6}', 0),
+            (h - 4, 0): (f'Operation hour: {self.volcano._operation_hours!s:<8}', 0),
+            (h - 2, 0): (f'Serial number: {self.volcano._serial_number!s:<12}', 0),
+            (h - 1, 0): (f'Firmware version: {self.volcano._firmware_version!s:<12}', 0),
+        }
+
+        dirty = False
 
-        self.screen.erase()
+        # Only repaint cells whose content actually changed
+        for pos, field in fields.items():
+            if self._last.get(pos) != field:
+                self._last[pos] = field
+                self.screen.addstr(pos[0], pos[1], field[0], field[1])
+                dirty = True
 
-        heater_on = 'ON' if self.volcano.heater_on else 'OFF'
-        pump_on = 'ON' if self.volcano.pump_on else 'OFF'
+        if dirty:
+            self.screen.noutrefresh()
+            curses.doupdate()
 
-        self.screen.addstr(cy - 2, cx - 7, f'Heater: ')
-        self.screen.addstr(heater_on, curses.color_pair(1 if self.volcano.heater_on else 2))
-        self.screen.addstr(cy - 1, cx - 5, f'Pump: ')
-        self.screen.addstr(pump_on, curses.color_pair(1 if self.volcano.pump_on else 2))
-        self.screen.addstr(cy, cx - 12, f'Target Temp: {self.volcano.target_temperature}')
-        self.screen.addstr(cy + 1, cx - 13, f'Current Temp: {self.volcano.temperature}')
+    @property
+    def target_temperature(self) -> int:
+        # Show the pending value while keypresses are being coalesced
+        if self._pending_target is not None:
+            return self._pending_target
 
-        self.screen.addstr(h - 5, 0, f'Auto off time: {self.volcano._auto_off_time}')
-        self.screen.addstr(h - 4, 0, f'Operation hour: {self.volcano._operation_hours}')
-        self.screen.addstr(h - 2, 0, f'Serial number: {self.volcano._serial_number}')
-        self.screen.addstr(h - 1, 0, f'Firmware version: {self.volcano._firmware_version}')
+        return self.volcano.target_temperature
 
-        self.screen.refresh()
+    def _adjust_target(self, delta: int) -> None:
+        if self._pending_target is None:
+            self._pending_target = self.volcano.target_temperature
+
+        self._pending_target += delta
+
+        # Restart the debounce window so only the final value is written.
+        # A flush past its sleep detaches itself below, so a non-None
+        # task here is still sleeping and safe to cancel
+        if self._debounce_task is not None:
+            self._debounce_task.cancel()
+
+        self._debounce_task = asyncio.create_task(self._flush_target(0.15))
+
+    async def _flush_target(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+
+        # Past the sleep, cancellation would abort an in-flight GATT
+        # write; detach so a new keypress schedules a fresh flush instead
+        self._debounce_task = None
+        target = self._pending_target
+
+        await self.volcano.set_target_temperature(target)
+
+        # Clear the pending value only if no further input arrived during
+        # the write; otherwise the flush that input scheduled owns it
+        if self._debounce_task is None and self._pending_target == target:
+            self._pending_target = None
 
     async def handle_char(self, char: int) -> None:
-        if chr(char) == "q":
-            self.set_exit()
-        if char == curses.KEY_UP:
-            await self.volcano.set_target_temperature(self.volcano.target_temperature + 1)
-        elif char == curses.KEY_DOWN:
-            await self.volcano.set_target_temperature(self.volcano.target_temperature - 1)
-        elif char == curses.KEY_LEFT:
-            await self.volcano.toggle_heater()
-        elif char == curses.KEY_RIGHT:
-            await self.volcano.toggle_pump()
+        handler = self._keymap.get(char)
+
+        if handler is None:
+            return
+
+        result = handler()
+        if inspect.iscoroutine(result):
+            await result
 
 
 async def display_main(screen):
+    # Imported here so the CLI doesn't pay the bleak import cost up front
+    from volcanobt.volcano import Volcano
+
     _LOGGER.info('STARTING APPLICATION')
 
     curses.curs_set(0)
@@ -100,12 +193,12 @@ async def display_main(screen):
 
     screen.nodelay(True)
     screen.clear()
-    screen.timeout(100)
+    screen.timeout(0)
 
     h, w = screen.getmaxyx()
 
-    cy = math.floor(h / 2)
-    cx = math.floor(w / 2)
+    cy = h // 2
+    cx = w // 2
 
     screen.addstr(cy, cx - 7, 'CONNECTING...')
 
@@ -126,7 +219,19 @@ async def display_main(screen):
 
     await volcano.connect()
 
-    asyncio.create_task(volcano.read_attributes())
+    # Repaint when the device pushes an update, not on a wall-clock tick
+    volcano.on_temperature_changed(lambda temperature: display.refresh())
+    volcano.on_target_temperature_changed(lambda temperature: display.refresh())
+    volcano.on_heater_changed(lambda state: display.refresh())
+    volcano.on_pump_changed(lambda state: display.refresh())
+
+    async def load_attributes():
+        # The static fields fill via plain GATT reads that fire no
+        # change callbacks, so repaint once they are populated
+        await volcano.read_attributes()
+        display.refresh()
+
+    asyncio.create_task(load_attributes())
 
     try:
         await display.run()
@@ -1,6 +1,8 @@
 import logging
 import asyncio
+import codecs
 import struct
+import sys
 from typing import Callable, Union, Final
 
 from volcanobt.connection import BTLEConnection
@@ -10,31 +12,31 @@ _LOGGER = logging.getLogger(__name__)
 TEMP_CELSIUS: Final = "°C"
 TEMP_FAHRENHEIT: Final = "°F"
 
-VOLCANO_STAT_SERVICE_UUID = "10100000-5354-4f52-5a26-4249434b454c"
-VOLCANO_HW_SERVICE_UUID = "10110000-5354-4f52-5a26-4249434b454c"
+VOLCANO_STAT_SERVICE_UUID = sys.intern("10100000-5354-4f52-5a26-4249434b454c")
+VOLCANO_HW_SERVICE_UUID = sys.intern("10110000-5354-4f52-5a26-4249434b454c")
 
-VOLCANO_TEMP_CURR_UUID = "10110001-5354-4f52-5a26-4249434b454c"
-VOLCANO_TEMP_TARGET_UUID = "10110003-5354-4f52-5a26-4249434b454c"
+VOLCANO_TEMP_CURR_UUID = sys.intern("10110001-5354-4f52-5a26-4249434b454c")
+VOLCANO_TEMP_TARGET_UUID = sys.intern("10110003-5354-4f52-5a26-4249434b454c")
 
-VOLCANO_HEAT_ON_UUID = "1011000f-5354-4f52-5a26-4249434b454c"
-VOLCANO_HEAT_OFF_UUID = "10110010-5354-4f52-5a26-4249434b454c"
+VOLCANO_HEAT_ON_UUID = sys.intern("1011000f-5354-4f52-5a26-4249434b454c")
+VOLCANO_HEAT_OFF_UUID = sys.intern("10110010-5354-4f52-5a26-4249434b454c")
 
-VOLCANO_PUMP_ON_UUID = "10110013-5354-4f52-5a26-4249434b454c"
-VOLCANO_PUMP_OFF_UUID = "10110014-5354-4f52-5a26-4249434b454c"
+VOLCANO_PUMP_ON_UUID = sys.intern("10110013-5354-4f52-5a26-4249434b454c")
+VOLCANO_PUMP_OFF_UUID = sys.intern("10110014-5354-4f52-5a26-4249434b454c")
 
-VOLCANO_AUTO_OFF_TIME_UUID = "1011000c-5354-4f52-5a26-4249434b454c"
-VOLCANO_SHUT_OFF_TIME_UUID = "1011000d-5354-4f52-5a26-4249434b454c"
-VOLCANO_OPERATION_HOURS_UUID = "10110015-5354-4f52-5a26-4249434b454c"
+VOLCANO_AUTO_OFF_TIME_UUID = sys.intern("1011000c-5354-4f52-5a26-4249434b454c")
+VOLCANO_SHUT_OFF_TIME_UUID = sys.intern("1011000d-5354-4f52-5a26-4249434b454c")
+VOLCANO_OPERATION_HOURS_UUID = sys.intern("10110015-5354-4f52-5a26-4249434b454c")
 
-VOLCANO_LED_BRIGHTNESS_UUID = "10110005-5354-4f52-5a26-4249434b454c"
+VOLCANO_LED_BRIGHTNESS_UUID = sys.intern("10110005-5354-4f52-5a26-4249434b454c")
 
-VOLCANO_SERIAL_NUMBER_UUID = "10100008-5354-4f52-5a26-4249434b454c"
-VOLCANO_FIRMWARE_VERSION_UUID = "10100003-5354-4f52-5a26-4249434b454c"
-VOLCANO_BLE_FIRMWARE_VERSION_UUID = "10100004-5354-4f52-5a26-4249434b454c"
+VOLCANO_SERIAL_NUMBER_UUID = sys.intern("10100008-5354-4f52-5a26-4249434b454c")
+VOLCANO_FIRMWARE_VERSION_UUID = sys.intern("10100003-5354-4f52-5a26-4249434b454c")
+VOLCANO_BLE_FIRMWARE_VERSION_UUID = sys.intern("10100004-5354-4f52-5a26-4249434b454c")
 
-VOLCANO_STAT1_REGISTER_UUID = "1010000c-5354-4f52-5a26-4249434b454c"
-VOLCANO_STAT2_REGISTER_UUID = "1010000d-5354-4f52-5a26-4249434b454c"
-VOLCANO_STAT3_REGISTER_UUID = "1010000e-5354-4f52-5a26-4249434b454c"
+VOLCANO_STAT1_REGISTER_UUID = sys.intern("1010000c-5354-4f52-5a26-4249434b454c")
+VOLCANO_STAT2_REGISTER_UUID = sys.intern("1010000d-5354-4f52-5a26-4249434b454c")
+VOLCANO_STAT3_REGISTER_UUID = sys.intern("1010000e-5354-4f52-5a26-4249434b454c")
 
 VOLCANO_STAT1_HEATER_ON_MASK = 0x0020
 VOLCANO_STAT1_PUMP_ON_MASK = 0x2000
@@ -47,18 +49,99 @@ VOLCANO_STAT3_VIBRATION_ENABLED_MASK = 0x400
 VOLCANO_STAT1_ERROR_MASK = 0x4018
 VOLCANO_STAT2_ERROR_MASK = 0x003B
 
+# Precompiled so hot paths skip the per-call format string parse
+_TEMP_STRUCT = struct.Struct('<I')
+_U16_STRUCT = struct.Struct('H')
+_U32_STRUCT = struct.Struct('I')
+_U16_BE_STRUCT = struct.Struct('>H')
+
+# The heater/pump command payload never varies, reuse one bytes object
+_ZERO_BYTE: Final = b'\x00'
+
+# All 8 combinations of the three stat1 bits decoded once at import:
+# key bit 0 = heater (register bit 5), bit 1 = pump (bit 13),
+# bit 2 = auto off disabled (bit 9)
+_STAT1_TABLE = tuple(
+    ((bits & 1) != 0, (bits & 2) != 0, (bits & 4) == 0)
+    for bits in range(8)
+)
+
+# Register writes only ever carry one of two payloads per mask (bit set
+# in the low word, or flagged for clearing via the high word), so both
+# encodings are packed once at import and picked by bool index
+def _mask_payloads(mask: int) -> tuple:
+    return _U32_STRUCT.pack(mask + 0x10000), _U32_STRUCT.pack(mask)
+
+_FAHRENHEIT_PAYLOADS = _mask_payloads(VOLCANO_STAT2_FAHRENHEIT_ENABLED_MASK)
+_DISPLAY_ON_COOLING_PAYLOADS = _mask_payloads(VOLCANO_STAT2_DISPLAY_ON_COOLING_MASK)
+_VIBRATION_PAYLOADS = _mask_payloads(VOLCANO_STAT3_VIBRATION_ENABLED_MASK)
+
 def celsius_to_fahrenheit(temperature: int) -> int:
     return (temperature * 1.8) + 32
 
 def fahrenheit_to_celsius(temperature: int) -> int:
     return (temperature - 32) / 1.8
 
+def _identity(temperature: int) -> int:
+    return temperature
+
+def _noop(*args) -> None:
+    pass
+
+_UTF8_DECODE = codecs.getdecoder('utf-8')
+
+def _decode_str(data: bytearray) -> str:
+    """Decode a fixed-width GATT string, stripping trailing NUL padding."""
+    return _UTF8_DECODE(data)[0].rstrip('\x00')
+
 class Volcano:
     """Volcano entity class"""
 
+    __slots__ = (
+        '_mac',
+        '_conn',
+        '_loop',
+        '_chars',
+        '_temperature',
+        '_target_temperature',
+        '_operation_hours',
+        '_serial_number',
+        '_firmware_version',
+        '_ble_firmware_version',
+        '_auto_off_time',
+        '_shut_off_time',
+        '_led_brightness',
+        '_heater_on',
+        '_pump_on',
+        '_auto_off_enabled',
+        '_temperature_unit',
+        '_convert',
+        '_display_on_cooling',
+        '_vibration_enabled',
+        '_temp_received',
+        '_target_temp_received',
+        '_stat1_received',
+        '_stat2_received',
+        '_stat3_received',
+        '_stat2_last_raw',
+        '_stat3_last_raw',
+        '_temperature_changed_callback',
+        '_target_temperature_changed_callback',
+        '_heater_changed_callback',
+        '_pump_changed_callback',
+        '_temperature_unit_changed_callback',
+        '_display_on_cooling_changed_callback',
+    )
+
+    # Static device metadata (serial, firmware) never changes for a given
+    # MAC, so it is shared across instances and survives reconnects
+    _static_cache: dict = {}
+
     def __init__(self, mac: str):
         self._mac = mac
+        self._loop = None
 
+        self._chars = {}
         self._temperature = 0
         self._target_temperature = 0
         self._operation_hours = None
@@ -74,17 +157,30 @@ class Volcano:
         self._auto_off_enabled = False
 
         self._temperature_unit = None
+        self._convert = _identity
         self._display_on_cooling = False
         self._vibration_enabled = False
 
-        self._temperature_changed_callback = None
-        self._target_temperature_changed_callback = None
-        self._heater_changed_callback = None
-        self._pump_changed_callback = None
-        self._temperature_unit_changed_callback = None
-        self._display_on_cooling_changed_callback = None
+        self._temp_received = asyncio.Event()
+        self._target_temp_received = asyncio.Event()
+        self._stat1_received = asyncio.Event()
+        self._stat2_received = asyncio.Event()
+        self._stat3_received = asyncio.Event()
+        self._stat2_last_raw = None
+        self._stat3_last_raw = None
+
+        # Default to a no-op so dispatch sites skip the None check
+        self._temperature_changed_callback = _noop
+        self._target_temperature_changed_callback = _noop
+        self._heater_changed_callback = _noop
+        self._pump_changed_callback = _noop
+        self._temperature_unit_changed_callback = _noop
+        self._display_on_cooling_changed_callback = _noop
 
     async def connect(self) -> bool:
+        # Captured once so notification handlers can hand user callbacks
+        # to the loop without a get_running_loop() call per dispatch
+        self._loop = asyncio.get_running_loop()
         self._conn = BTLEConnection(self._mac)
         result = await self._conn.connect()
         await self.register_notifications()
@@ -98,6 +194,45 @@ class Volcano:
     def is_connected(self) -> bool:
         return self._conn.is_connected
 
+    def _cache_characteristics(self) -> None:
+        """Walk the service collection once and cache every characteristic."""
+        for service in self._conn.services:
+            for char in service.characteristics:
+                self._chars[char.uuid] = char
+
+    def _char(self, uuid: str):
+        """Resolve a UUID to its cached characteristic object.
+
+        Passing the resolved object to bleak skips the UUID lookup across
+        the service collection on every read/write.
+        """
+        char = self._chars.get(uuid)
+
+        if char is None:
+            char = self._chars[uuid] = self._conn.services.get_characteristic(uuid)
+
+        return char
+
+    def _static(self) -> dict:
+        return Volcano._static_cache.setdefault(self._mac, {})
+
+    async def _read_unless_notified(self, event, uuid: str, parser, timeout: float = 2.0) -> None:
+        """Read a notifying characteristic only if no notification beat us.
+
+        The device pushes these values on its own once subscribed, so an
+        explicit GATT read is a round-trip for bytes the client already
+        has (or is about to get).
+        """
+        if event.is_set():
+            return
+
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            result = await self._conn.read_gatt_char(self._char(uuid))
+
+            parser(10, result)
+
     async def read_attributes(self) -> None:
         _LOGGER.debug('Reading BLE GATT attributes')
 
@@ -119,64 +254,74 @@ class Volcano:
 
     async def register_notifications(self) -> None:
         _LOGGER.info('Notifications registered')
-        await self._conn.start_notify(VOLCANO_TEMP_CURR_UUID, self._parse_temperature)
-        await self._conn.start_notify(VOLCANO_TEMP_TARGET_UUID, self._parse_target_temperature)
 
-        await self._conn.start_notify(VOLCANO_STAT1_REGISTER_UUID, self._parse_stat1_register)
-        await self._conn.start_notify(VOLCANO_STAT2_REGISTER_UUID, self._parse_stat2_register)
-        await self._conn.start_notify(VOLCANO_STAT3_REGISTER_UUID, self._parse_stat3_register)
+        self._cache_characteristics()
+
+        await asyncio.gather(
+            self._conn.start_notify(self._char(VOLCANO_TEMP_CURR_UUID), self._parse_temperature),
+            self._conn.start_notify(self._char(VOLCANO_TEMP_TARGET_UUID), self._parse_target_temperature),
+
+            self._conn.start_notify(self._char(VOLCANO_STAT1_REGISTER_UUID), self._parse_stat1_register),
+            self._conn.start_notify(self._char(VOLCANO_STAT2_REGISTER_UUID), self._parse_stat2_register),
+            self._conn.start_notify(self._char(VOLCANO_STAT3_REGISTER_UUID), self._parse_stat3_register),
+        )
 
     @property
     def temperature(self) -> int:
-        return self.convert_temp_unit(self._temperature)
+        return self._convert(self._temperature)
 
     async def read_temperature(self) -> None:
-        result = await self._conn.read_gatt_char(VOLCANO_TEMP_CURR_UUID)
-
-        self._parse_temperature(10, result)
+        await self._read_unless_notified(self._temp_received, VOLCANO_TEMP_CURR_UUID, self._parse_temperature)
 
     def _parse_temperature(self, sender: int, data: bytearray) -> None:
-        temperature = round(struct.unpack('<I', data)[0] / 10)
+        # Stay in integer arithmetic, this fires on every BLE notification
+        temperature = (int.from_bytes(data, "little") + 5) // 10
 
-        _LOGGER.debug(f"Received current temperature: {temperature}")
+        self._temp_received.set()
 
-        # Check for a uint16 overflow caused by BLE implementation
-        if temperature < 6536:
+        _LOGGER.debug("Received current temperature: %s", temperature)
+
+        # Check for a uint16 overflow caused by BLE implementation;
+        # identical readings are dropped before callback dispatch
+        if temperature < 6536 and temperature != self._temperature:
             self._temperature = temperature
-            if self._temperature_changed_callback:
-                self._temperature_changed_callback(temperature)
+            # Scheduled rather than called inline so a slow consumer
+            # can't delay the notification handler
+            self._loop.call_soon(self._temperature_changed_callback, temperature)
 
     def on_temperature_changed(self, callback: Callable[[int], None]) -> None:
         self._temperature_changed_callback = callback
 
     @property
     def target_temperature(self) -> int:
-        return self.convert_temp_unit(self._target_temperature)
+        return self._convert(self._target_temperature)
 
     async def set_target_temperature(self, temperature: int) -> None:
         # Volcano temps are always sent in celsius, then converted if displayed
         if self.temperature_unit == TEMP_FAHRENHEIT:
             temperature = fahrenheit_to_celsius(temperature)
 
-        data = struct.pack("<I", temperature * 10)
+        # Round once to the device's 0.1 degree encoding; fahrenheit input
+        # yields a float here and packing that would raise TypeError
+        encoded = int(round(temperature * 10))
 
-        await self._conn.write_gatt_char(VOLCANO_TEMP_TARGET_UUID, data)
+        await self._conn.write_gatt_char(self._char(VOLCANO_TEMP_TARGET_UUID), _TEMP_STRUCT.pack(encoded))
 
-        self._target_temperature = round(temperature)
+        self._target_temperature = encoded // 10
 
     async def read_target_temperature(self) -> None:
-        result = await self._conn.read_gatt_char(VOLCANO_TEMP_TARGET_UUID)
-
-        self._parse_target_temperature(10, result)
+        await self._read_unless_notified(self._target_temp_received, VOLCANO_TEMP_TARGET_UUID, self._parse_target_temperature)
 
     def _parse_target_temperature(self, sender: int, data: bytearray) -> None:
-        temperature = round(struct.unpack("<I", data)[0] / 10)
+        temperature = (int.from_bytes(data, "little") + 5) // 10
 
-        _LOGGER.debug(f"Received target temperature: {temperature}")
+        self._target_temp_received.set()
 
-        self._target_temperature = temperature
-        if self._target_temperature_changed_callback:
-            self._target_temperature_changed_callback(temperature)
+        _LOGGER.debug("Received target temperature: %s", temperature)
+
+        if temperature != self._target_temperature:
+            self._target_temperature = temperature
+            self._loop.call_soon(self._target_temperature_changed_callback, temperature)
 
     def on_target_temperature_changed(self, callback: Callable[[int], None]) -> None:
         self._target_temperature_changed_callback = callback
@@ -186,54 +331,69 @@ class Volcano:
         return self._operation_hours
 
     async def read_operation_hours(self) -> None:
-        result = await self._conn.read_gatt_char(VOLCANO_OPERATION_HOURS_UUID)
+        result = await self._conn.read_gatt_char(self._char(VOLCANO_OPERATION_HOURS_UUID))
 
-        self._operation_hours = int(struct.unpack("I", result)[0])
+        self._operation_hours = _U32_STRUCT.unpack(result)[0]
 
-        _LOGGER.debug(f"Received target temperature: {self.operation_hours}")
+        _LOGGER.debug("Received operation hours: %s", self.operation_hours)
 
     @property
     def serial_number(self) -> Union[str, None]:
         return self._serial_number
 
     async def read_serial_number(self) -> None:
-        result = await self._conn.read_gatt_char(VOLCANO_SERIAL_NUMBER_UUID)
+        static = self._static()
+
+        if 'serial_number' not in static:
+            result = await self._conn.read_gatt_char(self._char(VOLCANO_SERIAL_NUMBER_UUID))
 
-        self._serial_number = result.decode("utf-8")
+            static['serial_number'] = _decode_str(result)
 
-        _LOGGER.debug(f"Received serial number: {self.serial_number}")
+        self._serial_number = static['serial_number']
+
+        _LOGGER.debug("Received serial number: %s", self.serial_number)
 
     @property
     def firmware_version(self) -> Union[str, None]:
         return self._firmware_version
 
     async def read_firmware_version(self) -> None:
-        result = await self._conn.read_gatt_char(VOLCANO_FIRMWARE_VERSION_UUID)
+        static = self._static()
+
+        if 'firmware_version' not in static:
+            result = await self._conn.read_gatt_char(self._char(VOLCANO_FIRMWARE_VERSION_UUID))
 
-        self._firmware_version = result.decode('utf-8')
+            static['firmware_version'] = _decode_str(result)
 
-        _LOGGER.debug(f"Received firmware version: {self.firmware_version}")
+        self._firmware_version = static['firmware_version']
+
+        _LOGGER.debug("Received firmware version: %s", self.firmware_version)
 
     @property
     def ble_firmware_version(self) -> Union[str, None]:
         return self._ble_firmware_version
 
     async def read_ble_firmware_version(self) -> None:
-        result = await self._conn.read_gatt_char(VOLCANO_BLE_FIRMWARE_VERSION_UUID)
+        static = self._static()
+
+        if 'ble_firmware_version' not in static:
+            result = await self._conn.read_gatt_char(self._char(VOLCANO_BLE_FIRMWARE_VERSION_UUID))
 
-        self._ble_firmware_version = result.decode('utf-8')
-        _LOGGER.debug(f"Received ble firmware version: {self.ble_firmware_version}")
+            static['ble_firmware_version'] = _decode_str(result)
+
+        self._ble_firmware_version = static['ble_firmware_version']
+        _LOGGER.debug("Received ble firmware version: %s", self.ble_firmware_version)
 
     @property
     def auto_off_time(self) -> Union[int, None]:
         return self._auto_off_time
 
     async def read_auto_off_time(self) -> None:
-        result = await self._conn.read_gatt_char(VOLCANO_AUTO_OFF_TIME_UUID)
+        result = await self._conn.read_gatt_char(self._char(VOLCANO_AUTO_OFF_TIME_UUID))
 
-        self._auto_off_time = int(struct.unpack('H', result)[0])
+        self._auto_off_time = _U16_STRUCT.unpack(result)[0]
 
-        _LOGGER.debug(f"Received auto off time: {self.auto_off_time}")
+        _LOGGER.debug("Received auto off time: %s", self.auto_off_time)
 
     @property
     def shut_off_time(self) -> Union[int, None]:
@@ -241,29 +401,30 @@ class Volcano:
 
     async def read_shut_off_time(self) -> None:
 
-        result = await self._conn.read_gatt_char(VOLCANO_SHUT_OFF_TIME_UUID)
+        result = await self._conn.read_gatt_char(self._char(VOLCANO_SHUT_OFF_TIME_UUID))
 
-        self._shut_off_time = int(struct.unpack('H', result)[0])
-        _LOGGER.debug(f"Received shut off time: {self.shut_off_time}")
+        self._shut_off_time = _U16_STRUCT.unpack(result)[0]
+        _LOGGER.debug("Received shut off time: %s", self.shut_off_time)
 
     @property
     def led_brightness(self) -> Union[int, None]:
         return self._led_brightness
 
     async def set_led_brightness(self, brightness: int) -> None:
-        data = struct.pack('H', brightness)
+        data = _U16_STRUCT.pack(brightness)
 
-        await self._conn.write_gatt_char(VOLCANO_LED_BRIGHTNESS_UUID, data)
+        # Cosmetic setting; skip the response round-trip like heater/pump
+        await self._conn.write_gatt_char(self._char(VOLCANO_LED_BRIGHTNESS_UUID), data, response=False)
 
         self._led_brightness = round(brightness)
 
     async def read_led_brightness(self) -> None:
 
-        result = await self._conn.read_gatt_char(VOLCANO_LED_BRIGHTNESS_UUID)
+        result = await self._conn.read_gatt_char(self._char(VOLCANO_LED_BRIGHTNESS_UUID))
 
-        self._led_brightness = int(struct.unpack('H', result)[0] / 10)
+        self._led_brightness = int.from_bytes(result, 'little') // 10
 
-        _LOGGER.debug(f"Received led brightness: {self.led_brightness}")
+        _LOGGER.debug("Received led brightness: %s", self.led_brightness)
 
     @property
     def heater_on(self) -> bool:
@@ -271,10 +432,9 @@ class Volcano:
 
     async def set_heater(self,  state: bool) -> None:
         heater_uuid = VOLCANO_HEAT_ON_UUID if state else VOLCANO_HEAT_OFF_UUID
-        
-        data = struct.pack('B', 0)
 
-        await self._conn.write_gatt_char(heater_uuid, data)
+        # Fire-and-forget; the stat1 notification confirms the new state
+        await self._conn.write_gatt_char(self._char(heater_uuid), _ZERO_BYTE, response=False)
 
         self._heater_on = state
 
@@ -290,10 +450,8 @@ class Volcano:
 
     async def set_pump(self,  state: bool) -> None:
         pump_uuid = VOLCANO_PUMP_ON_UUID if state else VOLCANO_PUMP_OFF_UUID
-        
-        data = struct.pack('B', 0)
 
-        await self._conn.write_gatt_char(pump_uuid, data)
+        await self._conn.write_gatt_char(self._char(pump_uuid), _ZERO_BYTE, response=False)
 
         self._pump_on = state
 
@@ -308,40 +466,46 @@ class Volcano:
         return self._auto_off_enabled
 
     async def read_stat1_register(self) -> None:
-        result = await self._conn.read_gatt_char(VOLCANO_STAT1_REGISTER_UUID)
-
-        _LOGGER.info(result)
+        await self._read_unless_notified(self._stat1_received, VOLCANO_STAT1_REGISTER_UUID, self._parse_stat1_register, 1.0)
 
-        self._parse_stat1_register(10, result)
+    # Globals are bound as default-arg locals: LOAD_FAST instead of
+    # LOAD_GLOBAL in a function that runs on every notification
+    def _parse_stat1_register(self, sender: int, data: bytearray,
+                              _from_bytes=int.from_bytes, _table=_STAT1_TABLE) -> None:
+        data = _from_bytes(data, "little")
 
-    def _parse_stat1_register(self, sender: int, data: bytearray) -> None:
-        data = int.from_bytes(data, byteorder="little")
+        self._stat1_received.set()
 
-        self._heater_on = (data & VOLCANO_STAT1_HEATER_ON_MASK) != 0
-        self._pump_on = (data & VOLCANO_STAT1_PUMP_ON_MASK) != 0
-        self._auto_off_enabled = (data & VOLCANO_STAT1_AUTO_OFF_ENABLED_MASK) == 0
+        # Single table lookup instead of three mask tests per notification
+        key = ((data >> 5) & 1) | ((data >> 12) & 2) | ((data >> 7) & 4)
+        heater_on, pump_on, self._auto_off_enabled = _table[key]
 
-        _LOGGER.debug("Received stat1 register update:")
-        _LOGGER.debug(f"  - Pump      {self._heater_on}")
-        _LOGGER.debug(f"  - Heater    {self._pump_on}")
-        _LOGGER.debug(f"  - Auto off  {self._auto_off_enabled}")
+        _LOGGER.debug(
+            "Received stat1 register update: heater=%s pump=%s auto_off=%s",
+            heater_on, pump_on, self._auto_off_enabled,
+        )
 
-        if self._heater_changed_callback:
-            self._heater_changed_callback(self._heater_on)
+        # Only dispatch callbacks on an actual edge, so downstream
+        # consumers don't re-publish unchanged state on every notification
+        if heater_on != self._heater_on:
+            self._heater_on = heater_on
+            self._loop.call_soon(self._heater_changed_callback, heater_on)
 
-        if self._pump_changed_callback:
-            self._pump_changed_callback(self._pump_on)
+        if pump_on != self._pump_on:
+            self._pump_on = pump_on
+            self._loop.call_soon(self._pump_changed_callback, pump_on)
 
     @property
     def temperature_unit(self) -> Union[str, None]:
         return self._temperature_unit
 
     async def set_temperature_unit(self, unit: str) -> None:
-        data = self.encode_bit_mask(VOLCANO_STAT2_FAHRENHEIT_ENABLED_MASK, unit == TEMP_CELSIUS)
+        data = _FAHRENHEIT_PAYLOADS[unit == TEMP_CELSIUS]
 
-        await self._conn.write_gatt_char(VOLCANO_STAT2_REGISTER_UUID, data)
+        await self._conn.write_gatt_char(self._char(VOLCANO_STAT2_REGISTER_UUID), data)
 
         self._temperature_unit = unit
+        self._convert = celsius_to_fahrenheit if unit == TEMP_FAHRENHEIT else _identity
 
     def on_temperature_unit_changed(self, callback: Callable[[str], None]) -> None:
         self._temperature_unit_changed_callback = callback
@@ -351,9 +515,9 @@ class Volcano:
         return self._display_on_cooling
 
     async def set_display_on_cooling(self, state: bool) -> None:
-        data = self.encode_bit_mask(VOLCANO_STAT2_DISPLAY_ON_COOLING_MASK, state)
+        data = _DISPLAY_ON_COOLING_PAYLOADS[state]
 
-        await self._conn.write_gatt_char(VOLCANO_STAT2_REGISTER_UUID, data)
+        await self._conn.write_gatt_char(self._char(VOLCANO_STAT2_REGISTER_UUID), data)
 
         self._display_on_cooling = state
     
@@ -361,12 +525,21 @@ class Volcano:
         self._display_on_cooling_changed_callback = callback
 
     async def read_stat2_register(self) -> None:
-        result = await self._conn.read_gatt_char(VOLCANO_STAT2_REGISTER_UUID)
+        await self._read_unless_notified(self._stat2_received, VOLCANO_STAT2_REGISTER_UUID, self._parse_stat2_register, 1.0)
+
+    def _parse_stat2_register(self, sender: int, data: bytearray,
+                              _unpack_from=_U16_BE_STRUCT.unpack_from) -> None:
+        # unpack_from reads straight out of the buffer, no slice allocation
+        data = _unpack_from(data, 1)[0]
 
-        self._parse_stat2_register(10, result)
+        self._stat2_received.set()
 
-    def _parse_stat2_register(self, sender: int, data: bytearray) -> None:
-        data = int.from_bytes(data[1:3], byteorder="big")
+        # Stat2 fires on temperature change while cooling even when nothing
+        # changed; bail out before decoding the bits again
+        if data == self._stat2_last_raw:
+            return
+
+        self._stat2_last_raw = data
 
         #if (data & VOLCANO_STAT2_FAHRENHEIT_ENABLED_MASK) == 0:
         #    self._temperature_unit = TEMP_CELSIUS
@@ -379,8 +552,10 @@ class Volcano:
 
         if self._temperature_unit != temperature_unit:
             self._temperature_unit = temperature_unit
-            if self._temperature_unit_changed_callback:
-                self._temperature_unit_changed_callback(self._temperature_unit)
+            # Rebind the converter on the rare unit change so the hot
+            # property path is a single attribute load and call
+            self._convert = celsius_to_fahrenheit if temperature_unit == TEMP_FAHRENHEIT else _identity
+            self._loop.call_soon(self._temperature_unit_changed_callback, temperature_unit)
 
         #self._display_on_cooling = (data & VOLCANO_STAT2_DISPLAY_ON_COOLING_MASK) == 0
 
@@ -388,12 +563,12 @@ class Volcano:
 
         if self._display_on_cooling != display_on_cooling:
             self._display_on_cooling = display_on_cooling
-            if self._display_on_cooling_changed_callback:
-                self._display_on_cooling_changed_callback(self._display_on_cooling)
+            self._loop.call_soon(self._display_on_cooling_changed_callback, display_on_cooling)
 
-        _LOGGER.debug("Received stat2 register update:")
-        _LOGGER.debug(f"  - Temperature unit   {self.temperature_unit}")
-        _LOGGER.debug(f"  - Display on cooling {self.display_on_cooling}")
+        _LOGGER.debug(
+            "Received stat2 register update: temperature_unit=%s display_on_cooling=%s",
+            self._temperature_unit, self._display_on_cooling,
+        )
 
         # self._temperature_unit_changed_callback(self._temperature_unit)
         # self._display_on_cooling_callback(self._display_on_cooling)
@@ -403,32 +578,27 @@ class Volcano:
         return self._vibration_enabled
 
     async def set_vibration_enabled(self,  state: bool) -> None:
-        data = self.encode_bit_mask(VOLCANO_STAT3_VIBRATION_ENABLED_MASK, state)
+        data = _VIBRATION_PAYLOADS[state]
 
-        await self._conn.write_gatt_char(VOLCANO_STAT3_REGISTER_UUID, data)
+        await self._conn.write_gatt_char(self._char(VOLCANO_STAT3_REGISTER_UUID), data)
 
         self._vibration_enabled = state
 
     async def read_stat3_register(self) -> None:
-        _LOGGER.debug("Reading stat3 register")
+        await self._read_unless_notified(self._stat3_received, VOLCANO_STAT3_REGISTER_UUID, self._parse_stat3_register, 1.0)
 
-        result = await self._conn.read_gatt_char(VOLCANO_STAT3_REGISTER_UUID)
+    def _parse_stat3_register(self, sender: int, data: bytearray,
+                              _unpack_from=_U16_BE_STRUCT.unpack_from) -> None:
+        data = _unpack_from(data, 1)[0]
 
-        self._parse_stat3_register(10, result)
+        self._stat3_received.set()
 
-    def _parse_stat3_register(self, sender: int, data: bytearray) -> None:
-        data = int.from_bytes(data[1:3], byteorder="big")
+        if data == self._stat3_last_raw:
+            return
 
-        if (data & VOLCANO_STAT3_VIBRATION_ENABLED_MASK) == 0:
-            self._vibration_enabled = True
-        else:
-            self._vibration_enabled = False
+        self._stat3_last_raw = data
 
-        _LOGGER.debug("Received stat3 register update:")
-        _LOGGER.debug(f"  - Vibration {self.vibration_enabled}")
+        self._vibration_enabled = not (data & VOLCANO_STAT3_VIBRATION_ENABLED_MASK)
 
-    def encode_bit_mask(self, mask: int, state: bool):
-        return struct.pack("I", mask if state else mask + 0x10000)
+        _LOGGER.debug("Received stat3 register update: vibration=%s", self._vibration_enabled)
 
-    def convert_temp_unit(self, temperature: int) -> int:
-        return temperature if self.temperature_unit != TEMP_FAHRENHEIT else (temperature * 1.8) + 32